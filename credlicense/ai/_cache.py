@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache Module
+
+Small JSON-file backed cache for AI analysis results, keyed by a stable
+hash of the provider/model/prompt. Identical analyses (CI re-scans,
+re-reports, remediation loops) hit the cache instead of paying a
+30-60 second network round-trip.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+CACHE_PATH = Path.home() / ".cache" / "credlicense" / "llm_cache.json"
+
+DEFAULT_TTL = 86400  # 1 day
+
+
+class LLMCache:
+    """File-backed cache for LLM analysis responses.
+
+    Entries are stored as {key: {"expires": ts, "value": dict}} in a
+    single JSON file, with an in-process dict serving as an L1 in front
+    of the file.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else CACHE_PATH
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+        # The multi-provider fan-out hits one cache from several
+        # threads; serialize access so set()/_flush() never dump a
+        # dict another thread is mutating or interleave file writes
+        self._lock = threading.Lock()
+
+    def _load(self):
+        """Load the on-disk cache into memory (once, lazily).
+
+        Callers must hold self._lock."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            if isinstance(entries, dict):
+                self._memory = entries
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            self._memory = {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for key, or None if missing/expired."""
+        with self._lock:
+            self._load()
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            if entry.get("expires", 0) < time.time():
+                self._memory.pop(key, None)
+                return None
+            return entry.get("value")
+
+    def set(self, key: str, value: Dict[str, Any], ttl: int = DEFAULT_TTL):
+        """Store value under key with a time-to-live in seconds."""
+        with self._lock:
+            self._load()
+            self._memory[key] = {"expires": time.time() + ttl, "value": value}
+            self._flush()
+
+    def _flush(self):
+        """Write the in-memory cache back to disk (best effort).
+
+        Callers must hold self._lock."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self._memory, f)
+        except OSError:
+            # Caching is an optimization only - never fail the analysis
+            pass
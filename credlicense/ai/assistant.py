@@ -5,26 +5,111 @@ AI Assistant Module
 Integrates with Ollama (local) and OpenRouter (cloud) for AI-powered analysis.
 """
 
+import gzip
+import hashlib
+import json
 import os
+# The module name is shadowed by _post's json= keyword argument
+from json import dumps as _json_dumps
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, List, Optional
 
+try:
+    # Optional: httpx with HTTP/2 multiplexes requests over one connection,
+    # which beats HTTP/1.1 keep-alive for API-heavy use. Falls back to the
+    # pooled requests.Session when not installed.
+    import httpx
+except ImportError:
+    httpx = None
+
+# Errors that mean "could not reach the server" on either HTTP stack
+_CONNECTION_ERRORS = (requests.exceptions.ConnectionError,)
+if httpx is not None:
+    _CONNECTION_ERRORS = _CONNECTION_ERRORS + (httpx.ConnectError,)
+
+from credlicense.ai._cache import LLMCache
+
+
+# Analysis prompt shared by all providers
+_ANALYSIS_PROMPT = """You are a security expert analyzing scan results for credentials and licenses.
+
+{summary}
+
+Please provide:
+1. Risk assessment (HIGH/MEDIUM/LOW)
+2. Top 3 security recommendations
+3. License compatibility concerns (if any)
+
+Be concise and actionable."""
+
+# Basic guidance for common licenses, keyed by SPDX-style name
+_LICENSE_GUIDANCE = {
+    "MIT": "Permissive license. Can be used freely with attribution.",
+    "Apache-2.0": "Permissive license. Requires attribution and license notice.",
+    "GPL-3.0": "Copyleft license. Derivative works must be GPL-3.0.",
+    "GPL-2.0": "Copyleft license. Derivative works must be GPL-2.0.",
+    "BSD-3-Clause": "Permissive license. Similar to MIT with additional clause.",
+    "AGPL-3.0": "Strong copyleft. Network use triggers distribution requirements.",
+}
+
+_LICENSE_ADVICE_TEMPLATE = """**License: {license_name}**
+
+{guidance}Actions:
+1. Ensure license compliance in your project
+2. Include required attribution/notices
+3. Check compatibility with your project's license
+4. Document all dependencies and their licenses
+"""
+
+# Shared action blocks for credential advice - the only per-finding
+# variation is the detector name and the verified flag
+_CRED_ACTIONS_VERIFIED = """⚠️  **CRITICAL**: This credential is VERIFIED and actively usable!
+
+Immediate actions:
+1. Rotate/revoke this credential immediately
+2. Review access logs for unauthorized usage
+3. Remove from all files and version control history
+4. Use environment variables or secret management systems
+"""
+
+_CRED_ACTIONS_UNVERIFIED = """Actions:
+1. Verify if this is a real credential
+2. If real, rotate/revoke immediately
+3. Remove from files and use proper secret management
+4. Add to .gitignore or equivalent
+"""
+
+# Model used for each provider (also part of the response-cache key)
+PROVIDER_MODELS = {
+    "ollama-cloud": "llama3.1:8b",
+    "ollama-local": "llama2",
+    "openrouter": "meta-llama/llama-3.1-8b-instruct:free",
+}
+
 
 class AIAssistant:
     """AI assistant for analyzing scan results and providing recommendations."""
-    
-    def __init__(self, provider: str = "ollama-cloud", openrouter_api_key: Optional[str] = None, 
-                 ollama_api_key: Optional[str] = None):
+
+    def __init__(self, provider: str = "ollama-cloud", openrouter_api_key: Optional[str] = None,
+                 ollama_api_key: Optional[str] = None, use_cache: bool = True):
         """
         Initialize AI assistant.
-        
+
         Args:
             provider: AI provider to use - "ollama-cloud" (default), "ollama-local", or "openrouter"
             openrouter_api_key: API key for OpenRouter (from environment or parameter)
             ollama_api_key: API key for Ollama CLOUD service (from environment or parameter)
                            Note: For local Ollama, no API key is needed
+            use_cache: Cache analysis responses locally and reuse them for
+                       identical prompts (skips the network round-trip)
         """
         self.provider = provider
+        self.use_cache = use_cache
+        self._cache = LLMCache() if use_cache else None
         self.openrouter_api_key = openrouter_api_key or os.getenv("OPENROUTER_API_KEY")
         self.ollama_api_key = ollama_api_key or os.getenv("OLLAMA_API_KEY")
         # Ollama CLOUD - cloud-based Ollama service with full API capabilities
@@ -32,7 +117,93 @@ class AIAssistant:
         self.ollama_cloud_url = "https://api.ollama.cloud/v1/chat/completions"
         # Ollama LOCAL - simple local server connection (no API key required)
         self.ollama_local_url = os.getenv("OLLAMA_LOCAL_URL", "http://localhost:11434")
-    
+
+        # Pooled session so repeated analyses reuse TCP/TLS connections
+        # instead of paying the full handshake cost per request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update({"Content-Type": "application/json"})
+
+        # Prefer an HTTP/2-capable httpx client when available
+        self._client = None
+        if httpx is not None:
+            try:
+                self._client = httpx.Client(
+                    http2=True,
+                    timeout=30.0,
+                    limits=httpx.Limits(max_keepalive_connections=8,
+                                        max_connections=16),
+                )
+            except ImportError:
+                # httpx installed without the http2 extra (h2)
+                self._client = httpx.Client(
+                    timeout=30.0,
+                    limits=httpx.Limits(max_keepalive_connections=8,
+                                        max_connections=16),
+                )
+
+    # Bodies below this size aren't worth the compression overhead
+    _GZIP_THRESHOLD = 1024
+
+    def _post(self, url: str, headers: Optional[Dict[str, str]] = None,
+              json: Optional[Dict[str, Any]] = None, timeout: int = 30,
+              compress: bool = True):
+        """POST via the httpx client when available, else the pooled session.
+
+        Large JSON bodies (prompts grow with detector/license counts) are
+        gzip-compressed; the cloud providers accept Content-Encoding: gzip
+        and the clients transparently decompress responses. Local Ollama
+        does not decompress request bodies (and there is no uplink to
+        save on localhost), so its caller passes compress=False; a 4xx
+        answer to a compressed request also falls back to one
+        uncompressed attempt rather than failing the analysis.
+        """
+        body = _json_dumps(json).encode()
+        if compress and len(body) >= self._GZIP_THRESHOLD:
+            gz_body = gzip.compress(body)
+            gz_headers = dict(headers or {})
+            gz_headers.setdefault("Content-Type", "application/json")
+            gz_headers["Content-Encoding"] = "gzip"
+            gz_headers["Accept-Encoding"] = "gzip"
+            if self._client is not None:
+                response = self._client.post(url, headers=gz_headers,
+                                             content=gz_body, timeout=timeout)
+            else:
+                response = self._session.post(url, headers=gz_headers,
+                                              data=gz_body, timeout=timeout)
+            if not 400 <= response.status_code < 500:
+                return response
+            # Server rejected the compressed body (e.g. 415) - retry
+            # uncompressed below
+
+        if self._client is not None:
+            return self._client.post(url, headers=headers, json=json,
+                                     timeout=timeout)
+        return self._session.post(url, headers=headers, json=json,
+                                  timeout=timeout)
+
+    def close(self):
+        """Close the underlying HTTP session and its connection pool."""
+        self._session.close()
+        if self._client is not None:
+            self._client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def analyze_findings(self, credentials: List[Dict[str, Any]], 
                         licenses: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -45,71 +216,95 @@ class AIAssistant:
         Returns:
             Analysis results with recommendations
         """
-        # Prepare summary for AI
         summary = self._prepare_summary(credentials, licenses)
-        
+        return self._analyze_provider(self.provider, summary)
+
+    def analyze_findings_multi(self, credentials: List[Dict[str, Any]],
+                               licenses: List[Dict[str, Any]],
+                               providers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze findings with several providers concurrently.
+
+        The provider calls are network-bound, so fanning them out across
+        threads overlaps their latencies: N x 30s becomes ~30s.
+
+        Args:
+            credentials: List of credential findings
+            licenses: List of license findings
+            providers: Provider names to query (see PROVIDER_MODELS)
+
+        Returns:
+            Mapping of provider name to its analysis result
+        """
+        summary = self._prepare_summary(credentials, licenses)
+
+        with ThreadPoolExecutor(max_workers=max(len(providers), 1)) as executor:
+            futures = {provider: executor.submit(self._analyze_provider, provider, summary)
+                       for provider in providers}
+            return {provider: future.result() for provider, future in futures.items()}
+
+    def _analyze_provider(self, provider: str, summary: str) -> Dict[str, Any]:
+        """Run one provider's analysis of a prepared summary, via the cache."""
+        # Check the local response cache before hitting the network
+        cache_key = None
+        if self._cache is not None:
+            cache_key = hashlib.sha256(json.dumps(
+                {"provider": provider,
+                 "model": PROVIDER_MODELS.get(provider, "unknown"),
+                 "prompt": summary},
+                sort_keys=True
+            ).encode()).hexdigest()
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return {**cached, "cached": True}
+
         # Get AI analysis based on provider
-        if self.provider == "ollama-cloud":
+        if provider == "ollama-cloud":
             analysis = self._analyze_with_ollama_cloud(summary)
-        elif self.provider == "ollama-local":
+        elif provider == "ollama-local":
             analysis = self._analyze_with_ollama_local(summary)
-        elif self.provider == "openrouter":
+        elif provider == "openrouter":
             analysis = self._analyze_with_openrouter(summary)
         else:
-            analysis = {"error": f"Unknown provider: {self.provider}. Use 'ollama-cloud', 'ollama-local', or 'openrouter'."}
-        
+            analysis = {"error": f"Unknown provider: {provider}. Use 'ollama-cloud', 'ollama-local', or 'openrouter'."}
+
+        # Only cache successful analyses
+        if cache_key is not None and "error" not in analysis:
+            self._cache.set(cache_key, analysis, ttl=86400)
+
         return analysis
     
-    def _prepare_summary(self, credentials: List[Dict[str, Any]], 
+    def _prepare_summary(self, credentials: List[Dict[str, Any]],
                         licenses: List[Dict[str, Any]]) -> str:
         """Prepare a summary of findings for AI analysis."""
-        credential_summary = f"Found {len(credentials)} potential credentials:\n"
-        
-        # Summarize by detector type
-        detectors = {}
-        for cred in credentials:
-            detector = cred.get("detector", "Unknown")
-            detectors[detector] = detectors.get(detector, 0) + 1
-        
-        for detector, count in detectors.items():
-            credential_summary += f"  - {detector}: {count}\n"
-        
-        license_summary = f"\nFound {len(licenses)} license references:\n"
-        
-        # Summarize by license type
-        license_types = {}
-        for lic in licenses:
-            license_name = lic.get("license", "Unknown")
-            license_types[license_name] = license_types.get(license_name, 0) + 1
-        
-        for license_name, count in license_types.items():
-            license_summary += f"  - {license_name}: {count}\n"
-        
-        return credential_summary + license_summary
+        # Counter counts in C in a single pass, and most_common() gives
+        # stable ordering so identical findings produce identical summaries
+        detectors = Counter(c.get("detector", "Unknown") for c in credentials)
+        license_types = Counter(l.get("license", "Unknown") for l in licenses)
+
+        return (
+            f"Found {len(credentials)} potential credentials:\n"
+            + "".join(f"  - {detector}: {count}\n"
+                      for detector, count in detectors.most_common())
+            + f"\nFound {len(licenses)} license references:\n"
+            + "".join(f"  - {license_name}: {count}\n"
+                      for license_name, count in license_types.most_common())
+        )
     
     def _analyze_with_ollama_cloud(self, summary: str) -> Dict[str, Any]:
         """Analyze using Ollama CLOUD API - full cloud service with advanced capabilities."""
         if not self.ollama_api_key:
             return {"error": "Ollama CLOUD API key not provided. Set OLLAMA_API_KEY environment variable."}
-        
-        try:
-            prompt = f"""You are a security expert analyzing scan results for credentials and licenses.
-
-{summary}
-
-Please provide:
-1. Risk assessment (HIGH/MEDIUM/LOW)
-2. Top 3 security recommendations
-3. License compatibility concerns (if any)
 
-Be concise and actionable."""
+        try:
+            prompt = _ANALYSIS_PROMPT.format(summary=summary)
 
             headers = {
                 "Authorization": f"Bearer {self.ollama_api_key}",
                 "Content-Type": "application/json",
             }
             
-            response = requests.post(
+            response = self._post(
                 self.ollama_cloud_url,
                 headers=headers,
                 json={
@@ -138,26 +333,18 @@ Be concise and actionable."""
     def _analyze_with_ollama_local(self, summary: str) -> Dict[str, Any]:
         """Analyze using local Ollama server - simple local connection for privacy-conscious users."""
         try:
-            prompt = f"""You are a security expert analyzing scan results for credentials and licenses.
-
-{summary}
-
-Please provide:
-1. Risk assessment (HIGH/MEDIUM/LOW)
-2. Top 3 security recommendations
-3. License compatibility concerns (if any)
-
-Be concise and actionable."""
+            prompt = _ANALYSIS_PROMPT.format(summary=summary)
 
             # Simple local server connection - just sync and done
-            response = requests.post(
+            response = self._post(
                 f"{self.ollama_local_url}/api/generate",
                 json={
                     "model": "llama2",  # Default local model
                     "prompt": prompt,
                     "stream": False
                 },
-                timeout=60  # Local can be slower
+                timeout=60,  # Local can be slower
+                compress=False  # Local Ollama doesn't decode gzip bodies
             )
             
             if response.status_code == 200:
@@ -171,24 +358,20 @@ Be concise and actionable."""
             else:
                 return {"error": f"Local Ollama request failed: {response.status_code}"}
                 
-        except requests.exceptions.ConnectionError:
+        except _CONNECTION_ERRORS:
             return {"error": f"Cannot connect to local Ollama at {self.ollama_local_url}. Make sure Ollama is running locally."}
         except Exception as e:
             return {"error": f"Local Ollama analysis failed: {str(e)}"}
     
     def _analyze_with_openrouter(self, summary: str) -> Dict[str, Any]:
         """Analyze using OpenRouter API."""
-        try:
-            prompt = f"""You are a security expert analyzing scan results for credentials and licenses.
-
-{summary}
-
-Please provide:
-1. Risk assessment (HIGH/MEDIUM/LOW)
-2. Top 3 security recommendations
-3. License compatibility concerns (if any)
+        # Check the key before any prompt building, matching the
+        # ollama-cloud path
+        if not self.openrouter_api_key:
+            return {"error": "OpenRouter API key not provided. Set OPENROUTER_API_KEY environment variable."}
 
-Be concise and actionable."""
+        try:
+            prompt = _ANALYSIS_PROMPT.format(summary=summary)
 
             headers = {
                 "Authorization": f"Bearer {self.openrouter_api_key}",
@@ -196,7 +379,7 @@ Be concise and actionable."""
                 "HTTP-Referer": "https://github.com/Grumpified-OGGVCT/Credential-License-Locator",
             }
             
-            response = requests.post(
+            response = self._post(
                 "https://openrouter.ai/api/v1/chat/completions",
                 headers=headers,
                 json={
@@ -232,52 +415,50 @@ Be concise and actionable."""
         
         return "No specific remediation advice available."
     
+    def get_remediation_advice_batch(self, findings: List[Dict[str, Any]]) -> List[str]:
+        """
+        Get remediation advice for many findings in one pass.
+
+        Args:
+            findings: List of finding dicts (credential and/or license)
+
+        Returns:
+            List of advice strings, one per finding, in input order
+        """
+        license_types = {"license_file", "license_header", "package_license"}
+        advice = []
+        append = advice.append
+
+        for finding in findings:
+            finding_type = finding.get("type")
+            if finding_type == "credential":
+                actions = (_CRED_ACTIONS_VERIFIED if finding.get("verified", False)
+                           else _CRED_ACTIONS_UNVERIFIED)
+                append(f"**Credential Detected: {finding.get('detector', 'Unknown')}**\n\n"
+                       + actions)
+            elif finding_type in license_types:
+                append(self._get_license_remediation(finding))
+            else:
+                append("No specific remediation advice available.")
+
+        return advice
+
     def _get_credential_remediation(self, finding: Dict[str, Any]) -> str:
         """Get remediation advice for credential findings."""
         detector = finding.get("detector", "Unknown")
         verified = finding.get("verified", False)
-        
-        advice = f"**Credential Detected: {detector}**\n\n"
-        
-        if verified:
-            advice += "⚠️  **CRITICAL**: This credential is VERIFIED and actively usable!\n\n"
-            advice += "Immediate actions:\n"
-            advice += "1. Rotate/revoke this credential immediately\n"
-            advice += "2. Review access logs for unauthorized usage\n"
-            advice += "3. Remove from all files and version control history\n"
-            advice += "4. Use environment variables or secret management systems\n"
-        else:
-            advice += "Actions:\n"
-            advice += "1. Verify if this is a real credential\n"
-            advice += "2. If real, rotate/revoke immediately\n"
-            advice += "3. Remove from files and use proper secret management\n"
-            advice += "4. Add to .gitignore or equivalent\n"
-        
-        return advice
+
+        actions = _CRED_ACTIONS_VERIFIED if verified else _CRED_ACTIONS_UNVERIFIED
+        return f"**Credential Detected: {detector}**\n\n" + actions
     
     def _get_license_remediation(self, finding: Dict[str, Any]) -> str:
         """Get remediation advice for license findings."""
         license_name = finding.get("license", "Unknown")
-        
-        advice = f"**License: {license_name}**\n\n"
-        
-        # Basic license guidance
-        license_guidance = {
-            "MIT": "Permissive license. Can be used freely with attribution.",
-            "Apache-2.0": "Permissive license. Requires attribution and license notice.",
-            "GPL-3.0": "Copyleft license. Derivative works must be GPL-3.0.",
-            "GPL-2.0": "Copyleft license. Derivative works must be GPL-2.0.",
-            "BSD-3-Clause": "Permissive license. Similar to MIT with additional clause.",
-            "AGPL-3.0": "Strong copyleft. Network use triggers distribution requirements.",
-        }
-        
-        if license_name in license_guidance:
-            advice += license_guidance[license_name] + "\n\n"
-        
-        advice += "Actions:\n"
-        advice += "1. Ensure license compliance in your project\n"
-        advice += "2. Include required attribution/notices\n"
-        advice += "3. Check compatibility with your project's license\n"
-        advice += "4. Document all dependencies and their licenses\n"
-        
-        return advice
+        guidance = _LICENSE_GUIDANCE.get(license_name, "")
+        if guidance:
+            guidance += "\n\n"
+
+        return _LICENSE_ADVICE_TEMPLATE.format(
+            license_name=license_name,
+            guidance=guidance
+        )
@@ -6,20 +6,21 @@ Provides a rich CLI experience for scanning credentials and licenses.
 """
 
 import json
-from pathlib import Path
+import os
 from typing import Optional
 
 import click
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from credlicense.core.credential_scanner import CredentialScanner
-from credlicense.core.license_scanner import LicenseScanner
-from credlicense.ai.assistant import AIAssistant
-from credlicense.utils.disclaimer import show_disclaimer
-from credlicense.utils.report_generator import ReportGenerator
+# Heavier imports (scanners, AI assistant, report generator, the rich
+# progress/table machinery, orjson) are deferred into the commands that
+# need them so `credlicense --help` and `credlicense disclaimer` start fast.
+
+try:
+    # Optional C-level JSON for faster result load/save on large scans
+    import orjson
+except ImportError:
+    orjson = None
 
 
 console = Console()
@@ -42,16 +43,36 @@ def main():
 @click.argument('directory', type=click.Path(exists=True))
 @click.option('--output', '-o', type=click.Path(), help='Output file for results (JSON)')
 @click.option('--ai/--no-ai', default=False, help='Enable AI-powered analysis')
-@click.option('--ai-provider', type=click.Choice(['ollama-cloud', 'ollama-local', 'openrouter']), 
-              default='ollama-cloud', help='AI provider: Ollama CLOUD (default), local Ollama, or OpenRouter')
-@click.option('--scan-type', type=click.Choice(['all', 'credentials', 'licenses']), 
+@click.option('--ai-provider', default='ollama-cloud',
+              help='AI provider: ollama-cloud (default), ollama-local, or openrouter. '
+                   'Comma-separate several (e.g. ollama-cloud,openrouter) to cross-check.')
+@click.option('--scan-type', type=click.Choice(['all', 'credentials', 'licenses']),
               default='all', help='Type of scan to perform')
-def scan(directory: str, output: Optional[str], ai: bool, ai_provider: str, scan_type: str):
+@click.option('--cache/--no-cache', 'ai_cache', default=True,
+              help='Reuse cached AI analyses for identical findings')
+@click.option('--verbose', '-v', is_flag=True, default=False,
+              help='Keep raw TruffleHog data on each finding (larger output)')
+@click.option('--verify/--no-verify', default=True,
+              help='Live-verify candidate credentials (slower; issues HTTP calls)')
+@click.option('--concurrency', type=int, default=None,
+              help='TruffleHog worker count (defaults to CPU count)')
+def scan(directory: str, output: Optional[str], ai: bool, ai_provider: str, scan_type: str,
+         ai_cache: bool, verbose: bool, verify: bool, concurrency: Optional[int]):
     """
     Scan a directory for credentials and licenses.
     
     Example: credlicense scan /path/to/project --ai --output results.json
     """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from credlicense.core.credential_scanner import CredentialScanner
+    from credlicense.core.license_scanner import LicenseScanner
+    from credlicense.ai.assistant import AIAssistant
+    from credlicense.utils.disclaimer import show_disclaimer
+
     # Show ethical disclaimer
     if not show_disclaimer():
         console.print("[red]Scan cancelled by user.[/red]")
@@ -71,66 +92,97 @@ def scan(directory: str, output: Optional[str], ai: bool, ai_provider: str, scan
         "summary": {}
     }
     
-    # Credential scanning
+    # Both scanners are I/O-bound (subprocess + filesystem walk), so a
+    # combined scan runs them concurrently and shares one progress display
+    scan_jobs = []
     if scan_type in ['all', 'credentials']:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Scanning for credentials...", total=None)
-            
-            cred_scanner = CredentialScanner()
-            try:
-                results["credentials"] = cred_scanner.scan_directory(directory)
-                progress.update(task, completed=True)
-                console.print(f"[green]✓[/green] Found {len(results['credentials'])} potential credentials")
-            except Exception as e:
-                console.print(f"[red]✗[/red] Credential scan failed: {e}")
-    
-    # License scanning
+        scan_jobs.append((
+            "credentials",
+            "Scanning for credentials...",
+            CredentialScanner(keep_raw=verbose, concurrency=concurrency,
+                              verify=verify).scan_directory,
+            "potential credentials"
+        ))
     if scan_type in ['all', 'licenses']:
+        scan_jobs.append((
+            "licenses",
+            "Scanning for licenses...",
+            LicenseScanner().scan_directory,
+            "license references"
+        ))
+
+    if scan_jobs:
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console
         ) as progress:
-            task = progress.add_task("Scanning for licenses...", total=None)
-            
-            lic_scanner = LicenseScanner()
-            try:
-                results["licenses"] = lic_scanner.scan_directory(directory)
-                progress.update(task, completed=True)
-                console.print(f"[green]✓[/green] Found {len(results['licenses'])} license references")
-            except Exception as e:
-                console.print(f"[red]✗[/red] License scan failed: {e}")
-    
+            with ThreadPoolExecutor(max_workers=len(scan_jobs)) as executor:
+                futures = {}
+                for key, description, scan_func, label in scan_jobs:
+                    task = progress.add_task(description, total=None)
+                    future = executor.submit(scan_func, directory)
+                    futures[future] = (key, task, label)
+
+                for future in as_completed(futures):
+                    key, task, label = futures[future]
+                    try:
+                        results[key] = future.result()
+                        progress.update(task, completed=True)
+                        console.print(f"[green]✓[/green] Found {len(results[key])} {label}")
+                    except Exception as e:
+                        console.print(f"[red]✗[/red] {key.capitalize()} scan failed: {e}")
+
+    # Summarize once so display and saved output share the same counts
+    results["summary"] = _compute_summary(results)
+
     # Display results
     _display_results(results)
-    
+
     # AI Analysis
     if ai:
-        console.print(f"\n[cyan]Running AI analysis with {ai_provider}...[/cyan]")
-        ai_assistant = AIAssistant(provider=ai_provider)
-        analysis = ai_assistant.analyze_findings(
-            results["credentials"],
-            results["licenses"]
-        )
-        
-        if "error" in analysis:
-            console.print(f"[yellow]AI Analysis failed: {analysis['error']}[/yellow]")
-        else:
-            console.print(Panel(
-                analysis.get("analysis", "No analysis available"),
-                title=f"AI Analysis ({analysis.get('provider', 'unknown')})",
-                border_style="cyan"
-            ))
-            results["ai_analysis"] = analysis
+        providers = [p.strip() for p in ai_provider.split(',') if p.strip()]
+        console.print(f"\n[cyan]Running AI analysis with {', '.join(providers)}...[/cyan]")
+
+        with AIAssistant(provider=providers[0], use_cache=ai_cache) as ai_assistant:
+            if len(providers) > 1:
+                # Fan out across providers concurrently to cross-check results
+                analyses = ai_assistant.analyze_findings_multi(
+                    results["credentials"],
+                    results["licenses"],
+                    providers
+                )
+            else:
+                analyses = {providers[0]: ai_assistant.analyze_findings(
+                    results["credentials"],
+                    results["licenses"]
+                )}
+
+        for provider, analysis in analyses.items():
+            if "error" in analysis:
+                console.print(f"[yellow]AI Analysis ({provider}) failed: {analysis['error']}[/yellow]")
+            else:
+                console.print(Panel(
+                    analysis.get("analysis", "No analysis available"),
+                    title=f"AI Analysis ({analysis.get('provider', provider)})",
+                    border_style="cyan"
+                ))
+
+        successful = {p: a for p, a in analyses.items() if "error" not in a}
+        if successful:
+            if len(providers) > 1:
+                results["ai_analysis_multi"] = successful
+            # Keep the single-provider shape for report generation
+            results["ai_analysis"] = next(iter(successful.values()))
     
     # Save results
     if output:
-        with open(output, 'w') as f:
-            json.dump(results, f, indent=2)
+        if orjson is not None:
+            with open(output, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output, 'w') as f:
+                json.dump(results, f, indent=2)
         console.print(f"\n[green]Results saved to: {output}[/green]")
     
     # Generate summary
@@ -148,9 +200,17 @@ def report(results_file: str, format: str, output: Optional[str]):
     
     Example: credlicense report results.json --format html --output report.html
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from credlicense.utils.report_generator import ReportGenerator
+
     try:
-        with open(results_file, 'r') as f:
-            results = json.load(f)
+        if orjson is not None:
+            with open(results_file, 'rb') as f:
+                results = orjson.loads(f.read())
+        else:
+            with open(results_file, 'r') as f:
+                results = json.load(f)
     except Exception as e:
         console.print(f"[red]Failed to load results: {e}[/red]")
         return
@@ -177,6 +237,58 @@ def report(results_file: str, format: str, output: Optional[str]):
     console.print(f"[green]Report generated: {output}[/green]")
 
 
+@main.command()
+def serve():
+    """
+    Run a long-lived scan daemon on a Unix socket.
+
+    Keeps scanners (and their pooled HTTP state) alive across scans so
+    repeated invocations skip Python startup. Use 'credlicense rscan'
+    to send scan requests to it.
+    """
+    from credlicense.utils.service import SOCKET_PATH, serve as run_service
+
+    console.print(f"[cyan]credlicense daemon listening on {SOCKET_PATH}[/cyan]")
+    try:
+        run_service()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Daemon stopped.[/yellow]")
+
+
+@main.command()
+@click.argument('directory', type=click.Path(exists=True))
+@click.option('--scan-type', type=click.Choice(['all', 'credentials', 'licenses']),
+              default='all', help='Type of scan to perform')
+@click.option('--output', '-o', type=click.Path(), help='Output file for results (JSON)')
+def rscan(directory: str, scan_type: str, output: Optional[str]):
+    """
+    Scan via a running 'credlicense serve' daemon.
+
+    Example: credlicense rscan /path/to/project --scan-type credentials
+    """
+    from credlicense.utils.service import request_scan
+
+    try:
+        results = request_scan(directory, scan_type=scan_type)
+    except ConnectionError as e:
+        console.print(f"[red]{e}[/red]")
+        return
+
+    if "error" in results:
+        console.print(f"[red]Scan failed: {results['error']}[/red]")
+        return
+
+    results["summary"] = _compute_summary(results)
+    _display_results(results)
+
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+        console.print(f"\n[green]Results saved to: {output}[/green]")
+
+    _display_summary(results)
+
+
 @main.command()
 def gui():
     """
@@ -192,12 +304,15 @@ def disclaimer():
     """
     Display the ethical use disclaimer.
     """
+    from credlicense.utils.disclaimer import show_disclaimer
+
     show_disclaimer(force=True)
 
 
 def _display_results(results: dict):
     """Display scan results in a formatted table."""
-    
+    from rich.table import Table
+
     # Credentials table
     if results["credentials"]:
         cred_table = Table(title="Credential Findings", show_header=True, header_style="bold magenta")
@@ -209,7 +324,7 @@ def _display_results(results: dict):
         for cred in results["credentials"][:20]:  # Show first 20
             cred_table.add_row(
                 cred.get("detector", "Unknown"),
-                str(Path(cred.get("file", "Unknown")).name),
+                cred.get("basename") or os.path.basename(cred.get("file", "Unknown")),
                 cred.get("severity", "UNKNOWN"),
                 "✓" if cred.get("verified") else "✗"
             )
@@ -232,7 +347,7 @@ def _display_results(results: dict):
             lic_table.add_row(
                 lic.get("type", "Unknown"),
                 lic.get("license", "Unknown"),
-                str(Path(source).name) if lic.get("file") else source
+                os.path.basename(source) if lic.get("file") else source
             )
         
         console.print("\n")
@@ -242,13 +357,29 @@ def _display_results(results: dict):
             console.print(f"[dim]... and {len(results['licenses']) - 20} more[/dim]")
 
 
+def _compute_summary(results: dict) -> dict:
+    """Compute summary counts from scan results in a single pass."""
+    verified_creds = 0
+    for cred in results["credentials"]:
+        verified_creds += bool(cred.get("verified"))
+
+    return {
+        "total_credentials": len(results["credentials"]),
+        "verified_credentials": verified_creds,
+        "total_licenses": len(results["licenses"]),
+    }
+
+
 def _display_summary(results: dict):
     """Display a summary of scan results."""
-    cred_count = len(results["credentials"])
-    lic_count = len(results["licenses"])
-    
-    verified_creds = sum(1 for c in results["credentials"] if c.get("verified"))
-    
+    from rich.panel import Panel
+
+    # Reuse counts computed during the scan when available
+    summary = results.get("summary") or _compute_summary(results)
+    cred_count = summary["total_credentials"]
+    lic_count = summary["total_licenses"]
+    verified_creds = summary["verified_credentials"]
+
     summary_text = f"""
 [bold]Scan Summary[/bold]
 
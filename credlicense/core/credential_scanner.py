@@ -5,16 +5,48 @@ Credential Scanner Module
 This module integrates TruffleHog for detecting credentials in files and repositories.
 """
 
+import os
+import shutil
 import subprocess
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+try:
+    # orjson parses JSON lines 2-5x faster than the stdlib; fall back
+    # silently when it isn't installed
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Resolve the binary once at import instead of attempting (and failing)
+# an exec + PATH search on every scan
+_TRUFFLEHOG = shutil.which("trufflehog")
+_warned_missing = False
+
 
 class CredentialScanner:
     """Scanner for detecting credentials using TruffleHog."""
-    
-    def __init__(self):
+
+    def __init__(self, keep_raw: bool = False, concurrency: Optional[int] = None,
+                 verify: bool = True, only_verified: bool = False):
+        """
+        Args:
+            keep_raw: Keep the full TruffleHog finding dict under "raw_data".
+                      Off by default - the raw dicts are large and nothing in
+                      the display/report path reads them.
+            concurrency: Worker count passed to TruffleHog (defaults to the
+                         CPU count).
+            verify: Attempt live verification of candidate credentials.
+                    Verification issues HTTP calls per candidate and usually
+                    dominates scan time; disable it for fast offline audits.
+            only_verified: Only report findings TruffleHog could verify.
+        """
+        self.keep_raw = keep_raw
+        self.concurrency = concurrency
+        self.verify = verify
+        self.only_verified = only_verified
         self.results: List[Dict[str, Any]] = []
     
     def scan_directory(self, directory: str) -> List[Dict[str, Any]]:
@@ -36,58 +68,123 @@ class CredentialScanner:
         if not directory_path.is_dir():
             raise ValueError(f"Path is not a directory: {directory}")
         
-        # Use TruffleHog to scan the filesystem
+        self._run_trufflehog(directory_path)
+
+        return self.results
+
+    def iter_scan(self, directory: str, cancel_event=None):
+        """Yield findings one at a time as TruffleHog reports them.
+
+        Streaming front-end to scan_directory: findings are also
+        accumulated in self.results, so get_summary works after the
+        generator is exhausted. Lets UIs show results as they arrive
+        instead of waiting for the whole scan.
+
+        Args:
+            cancel_event: Optional threading.Event; setting it stops the
+                          scan (and kills the TruffleHog process) at the
+                          next finding boundary.
+        """
+        self.results = []
+        directory_path = Path(directory).resolve()
+
+        if not directory_path.exists():
+            raise ValueError(f"Directory does not exist: {directory}")
+
+        if not directory_path.is_dir():
+            raise ValueError(f"Path is not a directory: {directory}")
+
+        for finding in self._iter_trufflehog(directory_path, cancel_event):
+            self.results.append(finding)
+            yield finding
+
+    def _run_trufflehog(self, target: Path):
+        """Run a TruffleHog filesystem scan on a file or directory and
+        append formatted findings to self.results."""
+        self.results.extend(self._iter_trufflehog(target))
+
+    def _iter_trufflehog(self, target: Path, cancel_event=None):
+        """Run a TruffleHog filesystem scan and yield formatted findings
+        as they stream out of the process."""
         # Note: This requires the standalone TruffleHog binary from https://github.com/trufflesecurity/trufflehog
         # NOT the truffleHog3 Python package
+        if not _TRUFFLEHOG:
+            global _warned_missing
+            if not _warned_missing:
+                _warned_missing = True
+                print("Warning: TruffleHog not installed.")
+                print("Install from: https://github.com/trufflesecurity/trufflehog")
+                print("Or use: brew install trufflehog (macOS) / Docker image available")
+            return
+
         try:
             # TruffleHog filesystem scan
             cmd = [
-                "trufflehog",
+                _TRUFFLEHOG,
                 "filesystem",
-                str(directory_path),
-                "--json"
+                str(target),
+                "--json",
+                "--concurrency", str(self.concurrency or os.cpu_count() or 1)
             ]
-            
-            result = subprocess.run(
+            if not self.verify:
+                cmd.append("--no-verification")
+            elif self.only_verified:
+                cmd.append("--only-verified")
+
+            # Stream stdout line by line instead of buffering the whole
+            # output - keeps memory flat on large repos and parses
+            # findings as they arrive
+            # stderr is discarded, not piped: TruffleHog logs there, and
+            # an unread pipe fills up and deadlocks the child against
+            # our stdout read loop
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                timeout=300  # 5 minute timeout
+                bufsize=1
             )
-            
-            if result.stdout:
-                # Parse JSON output line by line
-                for line in result.stdout.strip().split('\n'):
+
+            try:
+                for line in proc.stdout:
+                    if cancel_event is not None and cancel_event.is_set():
+                        proc.kill()
+                        break
                     if line.strip():
                         try:
-                            finding = json.loads(line)
-                            self.results.append(self._format_finding(finding))
-                        except json.JSONDecodeError:
+                            finding = _loads(line)
+                        except ValueError:
                             continue
-            
+                        yield self._format_finding(finding)
+            finally:
+                try:
+                    proc.wait(timeout=300)  # 5 minute timeout
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    raise
+
         except subprocess.TimeoutExpired:
             print("Warning: TruffleHog scan timed out")
-        except FileNotFoundError:
-            print("Warning: TruffleHog not installed.")
-            print("Install from: https://github.com/trufflesecurity/trufflehog")
-            print("Or use: brew install trufflehog (macOS) / Docker image available")
         except Exception as e:
             print(f"Error running TruffleHog: {e}")
-        
-        return self.results
-    
+
     def _format_finding(self, finding: Dict[str, Any]) -> Dict[str, Any]:
         """Format TruffleHog finding into standardized format."""
-        return {
+        file = finding.get("SourceMetadata", {}).get("Data", {}).get("Filesystem", {}).get("file", "Unknown")
+        formatted = {
             "type": "credential",
             "detector": finding.get("DetectorName", "Unknown"),
-            "file": finding.get("SourceMetadata", {}).get("Data", {}).get("Filesystem", {}).get("file", "Unknown"),
+            "file": file,
+            # Pre-split so display/report/AI paths don't re-parse the path
+            "basename": os.path.basename(file),
             "line": finding.get("SourceMetadata", {}).get("Data", {}).get("Filesystem", {}).get("line", 0),
             "secret": "***REDACTED***",
             "verified": finding.get("Verified", False),
             "severity": "HIGH" if finding.get("Verified", False) else "MEDIUM",
-            "raw_data": finding
         }
+        if self.keep_raw:
+            formatted["raw_data"] = finding
+        return formatted
     
     def scan_file(self, filepath: str) -> List[Dict[str, Any]]:
         """
@@ -100,13 +197,15 @@ class CredentialScanner:
             List of findings
         """
         file_path = Path(filepath).resolve()
-        
+
         if not file_path.exists():
             raise ValueError(f"File does not exist: {filepath}")
-        
-        # Scan the parent directory but filter for this file
-        parent_results = self.scan_directory(str(file_path.parent))
-        return [r for r in parent_results if r.get("file") == str(file_path)]
+
+        # TruffleHog accepts a single file path directly - no need to
+        # scan (and then filter) the whole parent directory
+        self.results = []
+        self._run_trufflehog(file_path)
+        return self.results
     
     def get_summary(self) -> Dict[str, Any]:
         """Get a summary of scan results."""
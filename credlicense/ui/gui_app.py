@@ -5,13 +5,28 @@ Graphical User Interface for Credential-License-Locator
 Provides an innovative and user-friendly GUI experience.
 """
 
+import os
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
+import queue
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
+try:
+    # C-level serializer - several times faster than stdlib json on
+    # large result dicts; fall back silently when it isn't installed
+    import orjson
+
+    def _dumps_indented(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps_indented(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
 from credlicense.core.credential_scanner import CredentialScanner
 from credlicense.core.license_scanner import LicenseScanner
 from credlicense.ai.assistant import AIAssistant
@@ -19,6 +34,136 @@ from credlicense.utils.disclaimer import DISCLAIMER_TEXT
 from credlicense.utils.report_generator import ReportGenerator
 
 
+# Indexed by bool(verified) - no per-row branch
+_VERIFIED_MARK = ("✗", "✓")
+
+# Static summary skeleton built once; per-scan values drop in via
+# format_map instead of re-evaluating an f-string template
+_SUMMARY_TMPL = ("""
+SCAN SUMMARY
+""" + "=" * 60 + """
+
+Directory: {directory}
+Scan Time: {ts}
+
+CREDENTIALS:
+  Total Found: {n_cred}
+  Verified: {verified}
+  Unverified: {unverified}
+
+LICENSES:
+  Total Found: {n_lic}
+
+""")
+
+
+@lru_cache(maxsize=4096)
+def _basename(path: str) -> str:
+    """Memoized basename - result sets repeat paths, and Path(...).name
+    would construct and parse a PurePath per row."""
+    return os.path.basename(path)
+
+
+class _VirtualTree(ttk.Treeview):
+    """Treeview that materializes only a window of rows around the viewport.
+
+    The full result list stays in Python as the model; at most WINDOW rows
+    exist as Tcl items at any time, so population cost is O(visible)
+    instead of O(N) and 10k+ findings no longer freeze the UI. Scrolling
+    near the edge of the materialized window swaps the window to follow.
+    """
+
+    WINDOW = 200   # rows materialized at a time
+    MARGIN = 50    # scroll this close to a window edge triggers a re-window
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        self._rows = []
+        self._window = (0, 0)
+        self._rewindowing = False
+
+    def set_model(self, rows, to_values):
+        """Replace the model; to_values maps a row to its column tuple.
+
+        Column tuples (including basename extraction) are computed once
+        here, so re-windowing during scroll is pure insert work.
+        """
+        self._rows = [to_values(row) for row in rows]
+        self._window = (0, 0)
+        self.delete(*self.get_children())
+        self._render_window(0)
+
+    def _render_window(self, first):
+        """Materialize WINDOW rows starting near index first."""
+        rows = self._rows
+        start = max(0, min(first, len(rows) - self.WINDOW))
+        end = min(len(rows), start + self.WINDOW)
+        if (start, end) == self._window:
+            return
+        # One delete call for the whole stale window, then a tight
+        # insert loop - avoids per-row Tcl round trips beyond the insert
+        # itself
+        self.delete(*self.get_children())
+        insert = self.insert
+        for i in range(start, end):
+            insert("", "end", iid=str(i), values=rows[i])
+        self._window = (start, end)
+
+    def _first_visible(self):
+        """Model index of the row at the top of the viewport."""
+        start, end = self._window
+        count = end - start
+        if not count:
+            return 0
+        return start + int(self.yview()[0] * count)
+
+    def extend_model(self, rows, to_values):
+        """Append rows to the model, materializing them only while the
+        window still has room at the end (streaming ingest path)."""
+        start, end = self._window
+        at_end = end == len(self._rows)
+        self._rows.extend(to_values(row) for row in rows)
+        if at_end and end - start < self.WINDOW:
+            insert = self.insert
+            model = self._rows
+            new_end = min(len(model), start + self.WINDOW)
+            for i in range(end, new_end):
+                insert("", "end", iid=str(i), values=model[i])
+            self._window = (start, new_end)
+
+    def _ensure_window(self):
+        """Re-window if the viewport has drifted near a window edge."""
+        if self._rewindowing or len(self._rows) <= self.WINDOW:
+            return
+        start, end = self._window
+        first = self._first_visible()
+        if (first - start < self.MARGIN and start > 0) or \
+           (end - first < self.MARGIN and end < len(self._rows)):
+            self._rewindowing = True
+            try:
+                self._render_window(first - self.WINDOW // 2)
+                new_start, new_end = self._window
+                # Keep the same model row at the top of the viewport
+                self.yview_moveto((first - new_start) / (new_end - new_start))
+            finally:
+                self._rewindowing = False
+
+    def wrap_yscroll(self, vsb):
+        """Return a -yscrollcommand callback that forwards to vsb.set
+        and then re-windows.
+
+        Mouse-wheel and keyboard scrolling run through the Treeview
+        class bindings straight into the Tcl widget command, bypassing
+        any Python yview override - but every scroll path reports its
+        new fraction through -yscrollcommand, so hooking it here covers
+        them all.
+        """
+        def _yscroll(first, last):
+            vsb.set(first, last)
+            self._ensure_window()
+        return _yscroll
+
+
 class CredentialLicenseGUI:
     """Main GUI application for Credential-License-Locator."""
     
@@ -35,10 +180,47 @@ class CredentialLicenseGUI:
         }
         
         self.scanning = False
-        
+
+        # One worker at a time runs scans; Stop sets the cancel event,
+        # which the scanners poll inside their file loops for true
+        # cooperative cancellation (not just between phases)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._cancel = threading.Event()
+
+        # Findings stream from the scan thread through this queue; the
+        # Tk main loop drains it periodically so rows appear as soon as
+        # they are found
+        self._result_q = queue.Queue()
+
+        # Disclaimer Toplevel, built once and hidden/reshown thereafter
+        self._disclaimer_win = None
+
+        # Maintained as credentials stream in, so the summary never
+        # needs a linear recount
+        self._verified_count = 0
+
+        # Latest status message, written from any thread under the lock
+        # and applied by a single repeating 100 ms drain on the Tk
+        # thread - O(runtime/100ms) Tcl events no matter how chatty the
+        # scan phases get, and no cross-thread root.after calls
+        self._status_latest = None
+        self._status_lock = threading.Lock()
+
+        # Signatures of the result lists last loaded into each tree -
+        # redisplays of unchanged results skip all Tcl work
+        self._last_cred_sig = None
+        self._last_lic_sig = None
+
+        # (key, text) of the last generated summary - redisplays with
+        # unchanged results reuse it instead of re-scanning findings
+        self._summary_cache = (None, None)
+
         # Setup UI
         self._setup_ui()
-        
+
+        # Start the repeating status drain
+        self.root.after(100, self._drain_status)
+
         # Show disclaimer on startup
         self._show_disclaimer()
     
@@ -194,6 +376,17 @@ class CredentialLicenseGUI:
         self.ai_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.ai_tab, text="🤖 AI Analysis")
         self._create_ai_tab()
+
+        # Tabs render lazily: _display_results only marks them dirty,
+        # and each is populated the first time the user views it
+        self._tab_renderers = {
+            str(self.summary_tab): ("summary", self._render_summary_tab),
+            str(self.credentials_tab): ("credentials", self._populate_credentials_tree),
+            str(self.licenses_tab): ("licenses", self._populate_licenses_tree),
+            str(self.ai_tab): ("ai", self._render_ai_tab),
+        }
+        self._tab_dirty = {}
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
     
     def _create_summary_tab(self):
         """Create summary tab content."""
@@ -216,7 +409,7 @@ class CredentialLicenseGUI:
         
         # Create treeview
         columns = ("Detector", "File", "Line", "Severity", "Verified")
-        self.cred_tree = ttk.Treeview(tree_frame, columns=columns, show="headings", height=20)
+        self.cred_tree = _VirtualTree(tree_frame, columns=columns, show="headings", height=20)
         
         # Define headings
         self.cred_tree.heading("Detector", text="Detector")
@@ -235,7 +428,8 @@ class CredentialLicenseGUI:
         # Scrollbars
         vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.cred_tree.yview)
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.cred_tree.xview)
-        self.cred_tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.cred_tree.configure(yscrollcommand=self.cred_tree.wrap_yscroll(vsb),
+                                 xscrollcommand=hsb.set)
         
         # Grid layout
         self.cred_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -251,7 +445,7 @@ class CredentialLicenseGUI:
         tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         columns = ("Type", "License", "Source", "Confidence")
-        self.lic_tree = ttk.Treeview(tree_frame, columns=columns, show="headings", height=20)
+        self.lic_tree = _VirtualTree(tree_frame, columns=columns, show="headings", height=20)
         
         self.lic_tree.heading("Type", text="Type")
         self.lic_tree.heading("License", text="License")
@@ -265,7 +459,8 @@ class CredentialLicenseGUI:
         
         vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.lic_tree.yview)
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.lic_tree.xview)
-        self.lic_tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.lic_tree.configure(yscrollcommand=self.lic_tree.wrap_yscroll(vsb),
+                                 xscrollcommand=hsb.set)
         
         self.lic_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         vsb.grid(row=0, column=1, sticky=(tk.N, tk.S))
@@ -295,7 +490,10 @@ class CredentialLicenseGUI:
         self.status_label = ttk.Label(status_frame, textvariable=self.status_var, relief=tk.SUNKEN)
         self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
-        self.progress_bar = ttk.Progressbar(status_frame, mode='indeterminate', length=200)
+        # Determinate and driven by scanner progress callbacks - no
+        # Tcl-timer repaints, and the position means something
+        self.progress_bar = ttk.Progressbar(status_frame, mode='determinate',
+                                            maximum=100, length=200)
         self.progress_bar.pack(side=tk.RIGHT, padx=(10, 0))
     
     def _browse_directory(self):
@@ -305,11 +503,20 @@ class CredentialLicenseGUI:
             self.dir_var.set(directory)
     
     def _show_disclaimer(self):
-        """Show ethical use disclaimer."""
+        """Show ethical use disclaimer.
+
+        The window (and its text insertion, which scales with content
+        size) is built once; later invocations just deiconify it.
+        """
+        if self._disclaimer_win is not None:
+            self._disclaimer_win.deiconify()
+            self._disclaimer_win.lift()
+            return
+
         disclaimer_window = tk.Toplevel(self.root)
         disclaimer_window.title("Ethical Use Disclaimer")
         disclaimer_window.geometry("700x600")
-        
+
         text_widget = scrolledtext.ScrolledText(
             disclaimer_window,
             wrap=tk.WORD,
@@ -320,15 +527,20 @@ class CredentialLicenseGUI:
         text_widget.pack(fill=tk.BOTH, expand=True)
         text_widget.insert("1.0", DISCLAIMER_TEXT)
         text_widget.configure(state=tk.DISABLED)
-        
+
         button_frame = ttk.Frame(disclaimer_window)
         button_frame.pack(fill=tk.X, padx=20, pady=10)
-        
+
         ttk.Button(
             button_frame,
             text="I Understand and Agree",
-            command=disclaimer_window.destroy
+            command=disclaimer_window.withdraw
         ).pack()
+
+        # Closing via the window manager hides it too, keeping the
+        # widget reusable
+        disclaimer_window.protocol("WM_DELETE_WINDOW", disclaimer_window.withdraw)
+        self._disclaimer_win = disclaimer_window
     
     def _start_scan(self):
         """Start the scanning process."""
@@ -347,12 +559,33 @@ class CredentialLicenseGUI:
         self.stop_button.config(state=tk.NORMAL)
         self.scanning = True
         
-        # Start progress bar
-        self.progress_bar.start()
-        
-        # Run scan in separate thread
-        scan_thread = threading.Thread(target=self._perform_scan, args=(directory,))
-        scan_thread.start()
+        # Reset progress
+        self.progress_bar['value'] = 0
+
+        # Fresh queue and empty trees; stale items from a stopped scan
+        # must not leak into this one
+        self._result_q = queue.Queue()
+        self._verified_count = 0
+        self._last_cred_sig = None
+        self._last_lic_sig = None
+        self.cred_tree.set_model([], self._cred_row_values)
+        self.lic_tree.set_model([], self._lic_row_values)
+
+        # Results from a previous scan must not survive either: a
+        # licenses-only scan never refills "credentials", and a stale
+        # list paired with the reset verified counter would render a
+        # wrong summary
+        self.results["credentials"] = []
+        self.results["licenses"] = []
+        self.results.pop("ai_analysis", None)
+
+        # Submit to the worker; the main loop polls for streamed
+        # findings until the "done" sentinel arrives
+        self._cancel.clear()
+        future = self._executor.submit(self._perform_scan, directory)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._scan_complete))
+        self.root.after(50, self._poll_queue)
     
     def _perform_scan(self, directory):
         """Perform the actual scanning (runs in separate thread)."""
@@ -360,29 +593,47 @@ class CredentialLicenseGUI:
             self._update_status("Scanning for credentials...")
             
             scan_type = self.scan_type_var.get()
-            
-            # Credential scanning
-            if scan_type in ['all', 'credentials'] and self.scanning:
+
+            # The license phase reports real percentages; TruffleHog
+            # gives no totals, so the credential phase advances at its
+            # boundaries and licenses fill the remaining band
+            lic_base = 40 if scan_type == 'all' else 0
+
+            cancel = self._cancel
+
+            # Credential scanning, streamed finding by finding
+            if scan_type in ['all', 'credentials'] and not cancel.is_set():
                 cred_scanner = CredentialScanner()
-                self.results["credentials"] = cred_scanner.scan_directory(directory)
-            
-            if not self.scanning:
+                self._set_progress(10)
+                for item in cred_scanner.iter_scan(directory, cancel_event=cancel):
+                    self._result_q.put(("cred", item))
+                self.results["credentials"] = cred_scanner.results
+                # Credentials-only scans have no license phase to fill
+                # the bar, so finish it here instead of dropping to 0
+                self._set_progress(lic_base if scan_type == 'all' else 100)
+
+            if cancel.is_set():
                 return
-            
+
             self._update_status("Scanning for licenses...")
-            
-            # License scanning
-            if scan_type in ['all', 'licenses'] and self.scanning:
+
+            # License scanning, streamed finding by finding
+            if scan_type in ['all', 'licenses'] and not cancel.is_set():
                 lic_scanner = LicenseScanner()
-                self.results["licenses"] = lic_scanner.scan_directory(directory)
-            
-            if not self.scanning:
+                lic_scale = (100 - lic_base) / 100
+                on_progress = lambda pct: self._set_progress(lic_base + pct * lic_scale)
+                for item in lic_scanner.iter_scan(directory, on_progress=on_progress,
+                                                  cancel_event=cancel):
+                    self._result_q.put(("lic", item))
+                self.results["licenses"] = lic_scanner.results
+
+            if cancel.is_set():
                 return
             
             self.results["directory"] = directory
             
             # AI Analysis
-            if self.ai_enabled_var.get() and self.scanning:
+            if self.ai_enabled_var.get() and not cancel.is_set():
                 self._update_status("Running AI analysis...")
                 
                 provider = self.ai_provider_var.get()
@@ -396,119 +647,176 @@ class CredentialLicenseGUI:
                 self.results["ai_analysis"] = ai_result
             
             # Update UI with results
-            if self.scanning:
+            if not cancel.is_set():
                 self.root.after(0, self._display_results)
-            
+
         except Exception as e:
             self.root.after(0, lambda: messagebox.showerror("Scan Error", f"An error occurred: {str(e)}"))
         finally:
-            self.root.after(0, self._scan_complete)
+            # _scan_complete runs via the future's done callback
+            self._result_q.put(("done", None))
+
+    def _poll_queue(self):
+        """Drain streamed findings into the result trees (Tk thread).
+
+        Reschedules itself until the scan thread posts the "done"
+        sentinel. Items are batched per tick so each poll costs one
+        extend_model call per tree regardless of arrival rate.
+        """
+        creds, lics = [], []
+        done = False
+        q = self._result_q
+        try:
+            while True:
+                kind, item = q.get_nowait()
+                if kind == "done":
+                    done = True
+                    break
+                (creds if kind == "cred" else lics).append(item)
+        except queue.Empty:
+            pass
+
+        if creds:
+            self._verified_count += sum(1 for c in creds if c.get("verified", False))
+            self.cred_tree.extend_model(creds, self._cred_row_values)
+        if lics:
+            self.lic_tree.extend_model(lics, self._lic_row_values)
+
+        if not done:
+            self.root.after(50, self._poll_queue)
     
     def _stop_scan(self):
         """Stop the scanning process."""
         self.scanning = False
-        self._scan_complete()
+        # Scanners poll this inside their file loops and bail out
+        self._cancel.set()
         messagebox.showinfo("Scan Stopped", "Scan process has been stopped.")
     
     def _scan_complete(self):
         """Called when scan is complete."""
         self.scan_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
-        self.progress_bar.stop()
+        self.progress_bar['value'] = 100
         self._update_status("Scan complete")
     
     def _display_results(self):
-        """Display scan results in the UI."""
-        # Update summary
-        summary = self._generate_summary()
-        self._update_summary_text(summary)
-        
-        # Update credentials tree
-        self._populate_credentials_tree()
-        
-        # Update licenses tree
-        self._populate_licenses_tree()
-        
-        # Update AI analysis
-        if "ai_analysis" in self.results:
-            ai_analysis = self.results["ai_analysis"]
-            if "error" in ai_analysis:
-                self._update_ai_text(f"AI Analysis Error: {ai_analysis['error']}")
-            else:
-                self._update_ai_text(
-                    f"Provider: {ai_analysis.get('provider', 'Unknown')}\n"
-                    f"Model: {ai_analysis.get('model', 'Unknown')}\n\n"
-                    f"{ai_analysis.get('analysis', 'No analysis available')}"
-                )
+        """Mark all tabs dirty and render only the visible one.
+
+        The rest are populated on demand from <<NotebookTabChanged>>, so
+        scan completion pays for one tab's rendering, not four.
+        """
+        self._tab_dirty = {"summary": True, "credentials": True,
+                           "licenses": True, "ai": True}
+        self._on_tab_changed()
+
+    def _on_tab_changed(self, event=None):
+        """Render the selected tab if its contents are stale."""
+        renderer = self._tab_renderers.get(self.notebook.select())
+        if renderer is None:
+            return
+        name, render = renderer
+        if self._tab_dirty.get(name):
+            self._tab_dirty[name] = False
+            render()
+
+    def _render_summary_tab(self):
+        """Render the summary tab from current results."""
+        self._update_summary_text(self._generate_summary())
+
+    def _render_ai_tab(self):
+        """Render the AI analysis tab from current results."""
+        if "ai_analysis" not in self.results:
+            return
+        ai_analysis = self.results["ai_analysis"]
+        if "error" in ai_analysis:
+            self._update_ai_text(f"AI Analysis Error: {ai_analysis['error']}")
+        else:
+            self._update_ai_text(
+                f"Provider: {ai_analysis.get('provider', 'Unknown')}\n"
+                f"Model: {ai_analysis.get('model', 'Unknown')}\n\n"
+                f"{ai_analysis.get('analysis', 'No analysis available')}"
+            )
     
     def _generate_summary(self):
         """Generate summary text."""
         creds = self.results.get("credentials", [])
         lics = self.results.get("licenses", [])
-        
-        verified = sum(1 for c in creds if c.get("verified", False))
-        
-        summary = f"""
-SCAN SUMMARY
-{'=' * 60}
 
-Directory: {self.results.get('directory', 'Unknown')}
-Scan Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        key = (len(creds), len(lics), id(creds), id(lics))
+        if key == self._summary_cache[0]:
+            return self._summary_cache[1]
 
-CREDENTIALS:
-  Total Found: {len(creds)}
-  Verified: {verified}
-  Unverified: {len(creds) - verified}
+        # Counted incrementally as credentials streamed in
+        verified = self._verified_count
+
+        # Build once via join - no intermediate concatenation copies
+        parts = [_SUMMARY_TMPL.format_map({
+            "directory": self.results.get("directory", "Unknown"),
+            "ts": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "n_cred": len(creds),
+            "verified": verified,
+            "unverified": len(creds) - verified,
+            "n_lic": len(lics),
+        })]
 
-LICENSES:
-  Total Found: {len(lics)}
-  
-"""
-        
         if verified > 0:
-            summary += f"\n⚠️  WARNING: {verified} VERIFIED credential(s) found!\n"
-            summary += "These are actively usable and should be rotated IMMEDIATELY!\n"
-        
+            parts.append(f"\n⚠️  WARNING: {verified} VERIFIED credential(s) found!\n")
+            parts.append("These are actively usable and should be rotated IMMEDIATELY!\n")
+
+        summary = "".join(parts)
+        self._summary_cache = (key, summary)
         return summary
     
     def _populate_credentials_tree(self):
         """Populate credentials tree view."""
-        # Clear existing items
-        for item in self.cred_tree.get_children():
-            self.cred_tree.delete(item)
-        
-        # Add new items
-        for cred in self.results.get("credentials", []):
-            verified_mark = "✓" if cred.get("verified", False) else "✗"
-            
-            self.cred_tree.insert("", "end", values=(
-                cred.get("detector", "Unknown"),
-                Path(cred.get("file", "Unknown")).name,
-                cred.get("line", "N/A"),
-                cred.get("severity", "UNKNOWN"),
-                verified_mark
-            ))
-    
+        creds = self.results.get("credentials", [])
+        sig = (len(creds), id(creds))
+        if sig == self._last_cred_sig:
+            return
+        self._last_cred_sig = sig
+        self.cred_tree.set_model(creds, self._cred_row_values)
+
+    @staticmethod
+    def _cred_row_values(cred):
+        """Column tuple for one credential finding."""
+        # One bound .get instead of five method resolutions per row
+        get = cred.get
+        return (
+            get("detector", "Unknown"),
+            get("basename") or _basename(get("file", "Unknown")),
+            get("line", "N/A"),
+            get("severity", "UNKNOWN"),
+            _VERIFIED_MARK[bool(get("verified", False))]
+        )
+
     def _populate_licenses_tree(self):
         """Populate licenses tree view."""
-        # Clear existing items
-        for item in self.lic_tree.get_children():
-            self.lic_tree.delete(item)
-        
-        # Add new items
-        for lic in self.results.get("licenses", []):
-            source = lic.get("file", lic.get("package", "Unknown"))
-            source_display = Path(source).name if lic.get("file") else source
-            
-            self.lic_tree.insert("", "end", values=(
-                lic.get("type", "Unknown"),
-                lic.get("license", "Unknown"),
-                source_display,
-                lic.get("confidence", "N/A")
-            ))
+        lics = self.results.get("licenses", [])
+        sig = (len(lics), id(lics))
+        if sig == self._last_lic_sig:
+            return
+        self._last_lic_sig = sig
+        self.lic_tree.set_model(lics, self._lic_row_values)
+
+    @staticmethod
+    def _lic_row_values(lic):
+        """Column tuple for one license finding."""
+        get = lic.get
+        file = get("file")
+        source_display = _basename(file) if file else get("package", "Unknown")
+
+        return (
+            get("type", "Unknown"),
+            get("license", "Unknown"),
+            source_display,
+            get("confidence", "N/A")
+        )
     
     def _update_summary_text(self, text):
         """Update summary text widget."""
+        # Skip the delete/insert round trip when nothing changed
+        if text == self.summary_text.get("1.0", "end-1c"):
+            return
         self.summary_text.configure(state=tk.NORMAL)
         self.summary_text.delete("1.0", tk.END)
         self.summary_text.insert("1.0", text)
@@ -521,9 +829,26 @@ LICENSES:
         self.ai_text.insert("1.0", text)
         self.ai_text.configure(state=tk.DISABLED)
     
+    def _set_progress(self, value):
+        """Set the progress bar from any thread."""
+        self.root.after(0, self.progress_bar.configure, {"value": value})
+
     def _update_status(self, message):
-        """Update status bar message."""
-        self.root.after(0, lambda: self.status_var.set(message))
+        """Record the latest status message; safe from any thread.
+
+        Only the newest message survives until the next drain tick -
+        intermediate ones were already stale.
+        """
+        with self._status_lock:
+            self._status_latest = message
+
+    def _drain_status(self):
+        """Apply the latest status message and reschedule (Tk thread)."""
+        with self._status_lock:
+            message, self._status_latest = self._status_latest, None
+        if message is not None:
+            self.status_var.set(message)
+        self.root.after(100, self._drain_status)
     
     def _export_report(self):
         """Export results to a file."""
@@ -565,23 +890,38 @@ LICENSES:
                 )
             
             if filename:
-                try:
-                    if format_var.get() == "json":
-                        with open(filename, 'w') as f:
-                            json.dump(self.results, f, indent=2)
-                    else:
-                        generator = ReportGenerator()
-                        if format_var.get() == "html":
-                            generator.generate_html_report(self.results, filename)
-                        else:
-                            generator.generate_markdown_report(self.results, filename)
-                    
-                    messagebox.showinfo("Export Complete", f"Report exported to:\n{filename}")
-                except Exception as e:
-                    messagebox.showerror("Export Error", f"Failed to export report:\n{str(e)}")
-        
+                # Serialize and write off the Tk thread - large result
+                # sets would otherwise freeze the UI for the duration
+                self._update_status("Exporting report...")
+                threading.Thread(
+                    target=self._export_worker,
+                    args=(filename, format_var.get()),
+                    daemon=True
+                ).start()
+
         ttk.Button(format_window, text="Export", command=do_export).pack(pady=10)
 
+    def _export_worker(self, filename, export_format):
+        """Render and write the report (runs on a worker thread)."""
+        try:
+            if export_format == "json":
+                with open(filename, 'wb') as f:
+                    f.write(_dumps_indented(self.results))
+            else:
+                generator = ReportGenerator()
+                if export_format == "html":
+                    generator.generate_html_report(self.results, filename)
+                else:
+                    generator.generate_markdown_report(self.results, filename)
+
+            self.root.after(0, lambda: messagebox.showinfo(
+                "Export Complete", f"Report exported to:\n{filename}"))
+        except Exception as e:
+            self.root.after(0, lambda: messagebox.showerror(
+                "Export Error", f"Failed to export report:\n{str(e)}"))
+        finally:
+            self._update_status("Ready")
+
 
 def launch_gui():
     """Launch the GUI application."""
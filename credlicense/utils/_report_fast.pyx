@@ -0,0 +1,51 @@
+# cython: language_level=3
+"""Compiled row builders for the fallback report writers.
+
+Optional extension: when Cython is available at build time, setup.py
+compiles this module and report_generator.py uses these builders for
+the per-row loops; otherwise the pure-Python loops run unchanged. The
+markup emitted here must stay byte-identical to the _HTML_CRED_ROW /
+_HTML_LIC_ROW templates in report_generator.py, and the tuple layout
+must match what _Norm produces.
+"""
+
+cdef str _CRED_ROW = '''
+                <tr>
+                    <td>%s</td>
+                    <td>%s</td>
+                    <td>%s</td>
+                    <td class="%s">%s</td>
+                    <td class="%s">%s</td>
+                </tr>
+'''
+
+cdef str _LIC_ROW = '''
+                <tr>
+                    <td>%s</td>
+                    <td>%s</td>
+                    <td>%s</td>
+                    <td>%s</td>
+                </tr>
+'''
+
+
+cpdef unicode build_cred_rows(list rows):
+    """Render all credential table rows as one HTML fragment."""
+    cdef list parts = []
+    cdef tuple row
+    for row in rows:
+        # row: (detector, file, line, severity, severity_class,
+        #       verified_class, verified_mark)
+        parts.append(_CRED_ROW % (row[0], row[1], row[2],
+                                  row[4], row[3], row[5], row[6]))
+    return ''.join(parts)
+
+
+cpdef unicode build_lic_rows(list rows):
+    """Render all license table rows as one HTML fragment."""
+    cdef list parts = []
+    cdef tuple row
+    for row in rows:
+        # row: (type, license, source, confidence)
+        parts.append(_LIC_ROW % row)
+    return ''.join(parts)
@@ -8,6 +8,7 @@ Displays important warnings and disclaimers about ethical use.
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm
+from rich.text import Text
 
 
 console = Console()
@@ -44,6 +45,14 @@ By using this tool, you acknowledge that you have read and agree to use it
 responsibly and in compliance with all applicable laws and regulations.
 """
 
+# Markup is parsed once at import; repeat displays reuse the renderable
+_DISCLAIMER_RENDERABLE = Panel(
+    Text.from_markup(DISCLAIMER_TEXT),
+    title="[bold]Credential-License-Locator - Ethical Use Agreement[/bold]",
+    border_style="red",
+    padding=(1, 2)
+)
+
 
 def show_disclaimer(force: bool = False) -> bool:
     """
@@ -55,12 +64,7 @@ def show_disclaimer(force: bool = False) -> bool:
     Returns:
         True if user accepts, False otherwise
     """
-    console.print(Panel(
-        DISCLAIMER_TEXT,
-        title="[bold]Credential-License-Locator - Ethical Use Agreement[/bold]",
-        border_style="red",
-        padding=(1, 2)
-    ))
+    console.print(_DISCLAIMER_RENDERABLE)
     
     if force:
         return True
@@ -72,9 +76,7 @@ def show_disclaimer(force: bool = False) -> bool:
         return False
 
 
-def show_security_warning():
-    """Display security best practices warning."""
-    warning = """
+_SECURITY_WARNING_RENDERABLE = Panel(Text.from_markup("""
 [bold yellow]🔒 SECURITY BEST PRACTICES[/bold yellow]
 
 If credentials are found:
@@ -87,6 +89,9 @@ If credentials are found:
 7. Enable secret scanning in your CI/CD pipeline
 
 Remember: Prevention is better than detection!
-"""
-    
-    console.print(Panel(warning, border_style="yellow"))
+"""), border_style="yellow")
+
+
+def show_security_warning():
+    """Display security best practices warning."""
+    console.print(_SECURITY_WARNING_RENDERABLE)
@@ -5,146 +5,342 @@ Report Generator Module
 Generates reports in various formats from scan results.
 """
 
-from datetime import datetime
-from pathlib import Path
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html import escape as _esc
 from typing import Dict, Any
 
 
-class ReportGenerator:
-    """Generate reports from scan results in various formats."""
-    
-    def generate_html_report(self, results: Dict[str, Any], output_path: str):
-        """Generate an HTML report."""
-        html_content = self._build_html_report(results)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-    
-    def generate_markdown_report(self, results: Dict[str, Any], output_path: str):
-        """Generate a Markdown report."""
-        md_content = self._build_markdown_report(results)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
-    
-    def _build_html_report(self, results: Dict[str, Any]) -> str:
-        """Build HTML report content."""
-        credentials = results.get("credentials", [])
-        licenses = results.get("licenses", [])
-        ai_analysis = results.get("ai_analysis", {})
-        
-        # Count statistics
-        total_creds = len(credentials)
-        verified_creds = sum(1 for c in credentials if c.get("verified", False))
-        total_licenses = len(licenses)
-        
-        html = f"""<!DOCTYPE html>
+# Static document head and stylesheet, emitted verbatim - built once
+# at import with real braces instead of re-parsing a brace-escaped
+# f-string per report
+_HTML_PROLOGUE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Credential & License Scan Report</title>
     <style>
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             max-width: 1200px;
             margin: 0 auto;
             padding: 20px;
             background-color: #f5f5f5;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 30px;
             border-radius: 10px;
             margin-bottom: 30px;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        .stats {{
+        }
+        .stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 20px;
             margin-bottom: 30px;
-        }}
-        .stat-card {{
+        }
+        .stat-card {
             background: white;
             padding: 20px;
             border-radius: 8px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .stat-number {{
+        }
+        .stat-number {
             font-size: 36px;
             font-weight: bold;
             color: #667eea;
-        }}
-        .stat-label {{
+        }
+        .stat-label {
             color: #666;
             margin-top: 5px;
-        }}
-        .section {{
+        }
+        .section {
             background: white;
             padding: 25px;
             border-radius: 8px;
             margin-bottom: 20px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 15px;
-        }}
-        th {{
+        }
+        th {
             background-color: #667eea;
             color: white;
             padding: 12px;
             text-align: left;
-        }}
-        td {{
+        }
+        td {
             padding: 10px;
             border-bottom: 1px solid #eee;
-        }}
-        tr:hover {{
+        }
+        tr:hover {
             background-color: #f8f9fa;
-        }}
-        .severity-high {{
+        }
+        .severity-high {
             color: #e74c3c;
             font-weight: bold;
-        }}
-        .severity-medium {{
+        }
+        .severity-medium {
             color: #f39c12;
             font-weight: bold;
-        }}
-        .severity-low {{
+        }
+        .severity-low {
             color: #3498db;
-        }}
-        .verified {{
+        }
+        .verified {
             color: #e74c3c;
-        }}
-        .footer {{
+        }
+        .footer {
             text-align: center;
             color: #666;
             margin-top: 40px;
             padding: 20px;
-        }}
-        .warning {{
+        }
+        .warning {
             background: #fff3cd;
             border-left: 4px solid #ffc107;
             padding: 15px;
             margin: 20px 0;
             border-radius: 4px;
-        }}
+        }
     </style>
 </head>
 <body>
-    <div class="header">
+"""
+
+# Row templates for the fallback writers; %-formatting over a tuple is
+# a single C call per row, cheaper than per-field formatting in a loop
+_HTML_CRED_ROW = """
+                <tr>
+                    <td>%s</td>
+                    <td>%s</td>
+                    <td>%s</td>
+                    <td class="%s">%s</td>
+                    <td class="%s">%s</td>
+                </tr>
+"""
+
+_HTML_LIC_ROW = """
+                <tr>
+                    <td>%s</td>
+                    <td>%s</td>
+                    <td>%s</td>
+                    <td>%s</td>
+                </tr>
+"""
+
+_MD_CRED_ROW = "| %s | %s | %s | %s | %s |\n"
+
+_MD_LIC_ROW = "| %s | %s | %s | %s |\n"
+
+# Severity is a small closed set; map it to its CSS class once instead
+# of lower-casing and formatting per row
+_SEV_CLASS = {
+    'HIGH': 'severity-high',
+    'MEDIUM': 'severity-medium',
+    'LOW': 'severity-low',
+    'UNKNOWN': 'severity-low',
+}
+
+try:
+    # Jinja2 compiles templates to bytecode once at import and streams
+    # rendered blocks; autoescaping HTML-escapes finding fields in the
+    # HTML template (paths with '<' or '&' no longer break the markup)
+    # but must stay off for Markdown, which emits free text verbatim
+    # like the fallback writer. The hand-rolled writers below remain
+    # the fallback.
+    from jinja2 import Environment, PackageLoader, select_autoescape
+
+    _env = Environment(loader=PackageLoader("credlicense", "templates"),
+                       autoescape=select_autoescape(("html.j2",)),
+                       keep_trailing_newline=True)
+    _env.filters["basename"] = os.path.basename
+    _HTML_TMPL = _env.get_template("report.html.j2")
+    _MD_TMPL = _env.get_template("report.md.j2")
+except ImportError:
+    _HTML_TMPL = _MD_TMPL = None
+
+try:
+    # Compiled row builders (built by setup.py when Cython is present);
+    # the pure-Python loops below are the fallback
+    from credlicense.utils._report_fast import build_cred_rows, build_lic_rows
+except ImportError:
+    build_cred_rows = build_lic_rows = None
+
+
+class _Utf8Writer:
+    """Encode str fragments to UTF-8 for a binary file object.
+
+    Writing pre-encoded bytes through a plain BufferedWriter skips the
+    incremental encoder that text mode runs on every write.
+    """
+
+    __slots__ = ("_write",)
+
+    def __init__(self, fp):
+        self._write = fp.write
+
+    def write(self, fragment: str):
+        self._write(fragment.encode('utf-8'))
+
+
+class _Norm:
+    """Scan results normalized once and shared by every output format.
+
+    Counts, the timestamp, and the per-row display fields (basename,
+    severity class, verified mark) are computed in a single pass here so
+    generating both HTML and Markdown does not walk the findings twice.
+    """
+
+    __slots__ = ("directory", "ts", "credentials", "licenses", "ai_analysis",
+                 "total_creds", "verified_creds", "total_licenses",
+                 "cred_rows", "lic_rows")
+
+    def __init__(self, results: Dict[str, Any]):
+        credentials = results.get("credentials", [])
+        licenses = results.get("licenses", [])
+        self.directory = results.get("directory", "Unknown")
+        # time.strftime skips the datetime object allocation
+        self.ts = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.credentials = credentials
+        self.licenses = licenses
+        self.ai_analysis = results.get("ai_analysis", {})
+        self.total_creds = len(credentials)
+        self.total_licenses = len(licenses)
+
+        # Text fields lifted from scan data are escaped here so names
+        # containing '&' or '<' cannot break the report markup (the
+        # Jinja2 path gets the same treatment from autoescape)
+        esc = _esc
+        verified_creds = 0
+        self.cred_rows = cred_rows = []
+        for cred in credentials:
+            get = cred.get
+            verified = get("verified", False)
+            if verified:
+                verified_creds += 1
+            severity = get("severity", "UNKNOWN")
+            cred_rows.append((
+                esc(get("detector", "Unknown")),
+                esc(os.path.basename(get("file") or "Unknown")),
+                get("line", "N/A"),
+                severity,
+                _SEV_CLASS.get(severity, 'severity-low'),
+                "verified" if verified else "",
+                "✓" if verified else "✗",
+            ))
+        self.verified_creds = verified_creds
+
+        self.lic_rows = lic_rows = []
+        for lic in licenses:
+            get = lic.get
+            source = get("file")
+            lic_rows.append((
+                esc(get("type", "Unknown")),
+                esc(get("license", "Unknown")),
+                esc(os.path.basename(source) if source
+                    else get("package", "Unknown")),
+                get("confidence", "N/A"),
+            ))
+
+
+class ReportGenerator:
+    """Generate reports from scan results in various formats."""
+
+    def __init__(self):
+        # Single-slot (key, norm) cache - producing both formats from
+        # the same results dict normalizes the findings only once
+        self._norm_cache = (None, None)
+
+    def _normalize(self, results: Dict[str, Any]) -> _Norm:
+        """Return the normalized view of results, reusing the last one."""
+        key = id(results)
+        cached_key, norm = self._norm_cache
+        if key != cached_key:
+            norm = _Norm(results)
+            self._norm_cache = (key, norm)
+        return norm
+
+    def generate_html_report(self, results: Dict[str, Any], output_path: str):
+        """Generate an HTML report."""
+        # 1 MiB buffer - bulk report writes hit the kernel far less
+        # often than with the 8 KB default
+        norm = self._normalize(results)
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            writer = _Utf8Writer(f)
+            if _HTML_TMPL is not None:
+                _HTML_TMPL.stream(self._template_context(norm)).dump(writer)
+            else:
+                self._write_html_report(norm, writer)
+
+    def generate_markdown_report(self, results: Dict[str, Any], output_path: str):
+        """Generate a Markdown report."""
+        # 1 MiB buffer - bulk report writes hit the kernel far less
+        # often than with the 8 KB default
+        norm = self._normalize(results)
+        with open(output_path, 'wb', buffering=1 << 20) as f:
+            writer = _Utf8Writer(f)
+            if _MD_TMPL is not None:
+                _MD_TMPL.stream(self._template_context(norm)).dump(writer)
+            else:
+                self._write_markdown_report(norm, writer)
+
+    def generate_all(self, results: Dict[str, Any], html_path: str, md_path: str):
+        """Generate HTML and Markdown reports concurrently.
+
+        Normalization runs once up front; the two writers then stream
+        to their files on separate threads, overlapping the file I/O.
+        """
+        self._normalize(results)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [
+                pool.submit(self.generate_html_report, results, html_path),
+                pool.submit(self.generate_markdown_report, results, md_path),
+            ]
+            for future in futures:
+                future.result()
+
+    @staticmethod
+    def _template_context(norm: _Norm) -> Dict[str, Any]:
+        """Shared render context for the Jinja2 templates."""
+        return {
+            "prologue": _HTML_PROLOGUE,
+            "ts": norm.ts,
+            "directory": norm.directory,
+            "credentials": norm.credentials,
+            "licenses": norm.licenses,
+            "ai_analysis": norm.ai_analysis,
+            "total_creds": norm.total_creds,
+            "verified_creds": norm.verified_creds,
+            "total_licenses": norm.total_licenses,
+        }
+
+    def _write_html_report(self, norm: _Norm, fp):
+        """Stream HTML report content to an open file.
+
+        Fragments go straight to the (buffered) file object, so the
+        full document is never held in memory."""
+        ai_analysis = norm.ai_analysis
+        verified_creds = norm.verified_creds
+
+        write = fp.write
+        write(_HTML_PROLOGUE)
+        write(f"""    <div class="header">
         <h1>🔍 Credential & License Scan Report</h1>
-        <p>Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-        <p>Directory: {results.get('directory', 'Unknown')}</p>
+        <p>Generated: {norm.ts}</p>
+        <p>Directory: {_esc(norm.directory)}</p>
     </div>
     
     <div class="stats">
         <div class="stat-card">
-            <div class="stat-number">{total_creds}</div>
+            <div class="stat-number">{norm.total_creds}</div>
             <div class="stat-label">Potential Credentials</div>
         </div>
         <div class="stat-card">
@@ -152,35 +348,35 @@ class ReportGenerator:
             <div class="stat-label">Verified Credentials</div>
         </div>
         <div class="stat-card">
-            <div class="stat-number">{total_licenses}</div>
+            <div class="stat-number">{norm.total_licenses}</div>
             <div class="stat-label">License References</div>
         </div>
     </div>
-"""
+""")
 
         # Warning for verified credentials
         if verified_creds > 0:
-            html += f"""
+            write(f"""
     <div class="warning">
         <strong>⚠️ CRITICAL:</strong> {verified_creds} verified credential(s) found! 
         These are actively usable and should be rotated immediately.
     </div>
-"""
+""")
 
         # AI Analysis
         if ai_analysis and "analysis" in ai_analysis:
-            html += f"""
+            write(f"""
     <div class="section">
         <h2>🤖 AI Analysis</h2>
-        <p><strong>Provider:</strong> {ai_analysis.get('provider', 'Unknown')}</p>
-        <p><strong>Model:</strong> {ai_analysis.get('model', 'Unknown')}</p>
-        <pre style="white-space: pre-wrap; background: #f8f9fa; padding: 15px; border-radius: 4px;">{ai_analysis.get('analysis', '')}</pre>
+        <p><strong>Provider:</strong> {_esc(ai_analysis.get('provider', 'Unknown'))}</p>
+        <p><strong>Model:</strong> {_esc(ai_analysis.get('model', 'Unknown'))}</p>
+        <pre style="white-space: pre-wrap; background: #f8f9fa; padding: 15px; border-radius: 4px;">{_esc(ai_analysis.get('analysis', ''))}</pre>
     </div>
-"""
+""")
 
         # Credentials table
-        if credentials:
-            html += """
+        if norm.cred_rows:
+            write("""
     <div class="section">
         <h2>🔐 Credential Findings</h2>
         <table>
@@ -194,30 +390,22 @@ class ReportGenerator:
                 </tr>
             </thead>
             <tbody>
-"""
-            for cred in credentials:
-                severity_class = f"severity-{cred.get('severity', 'low').lower()}"
-                verified_mark = "✓" if cred.get("verified", False) else "✗"
-                verified_class = "verified" if cred.get("verified", False) else ""
-                
-                html += f"""
-                <tr>
-                    <td>{cred.get('detector', 'Unknown')}</td>
-                    <td>{Path(cred.get('file', 'Unknown')).name}</td>
-                    <td>{cred.get('line', 'N/A')}</td>
-                    <td class="{severity_class}">{cred.get('severity', 'UNKNOWN')}</td>
-                    <td class="{verified_class}">{verified_mark}</td>
-                </tr>
-"""
-            html += """
+""")
+            if build_cred_rows is not None:
+                write(build_cred_rows(norm.cred_rows))
+            else:
+                for detector, file, line, severity, sev_cls, ver_cls, mark in norm.cred_rows:
+                    write(_HTML_CRED_ROW % (detector, file, line,
+                                            sev_cls, severity, ver_cls, mark))
+            write("""
             </tbody>
         </table>
     </div>
-"""
+""")
 
         # Licenses table
-        if licenses:
-            html += """
+        if norm.lic_rows:
+            write("""
     <div class="section">
         <h2>📜 License Findings</h2>
         <table>
@@ -230,59 +418,50 @@ class ReportGenerator:
                 </tr>
             </thead>
             <tbody>
-"""
-            for lic in licenses:
-                source = lic.get("file", lic.get("package", "Unknown"))
-                source_display = Path(source).name if lic.get("file") else source
-                
-                html += f"""
-                <tr>
-                    <td>{lic.get('type', 'Unknown')}</td>
-                    <td>{lic.get('license', 'Unknown')}</td>
-                    <td>{source_display}</td>
-                    <td>{lic.get('confidence', 'N/A')}</td>
-                </tr>
-"""
-            html += """
+""")
+            if build_lic_rows is not None:
+                write(build_lic_rows(norm.lic_rows))
+            else:
+                for row in norm.lic_rows:
+                    write(_HTML_LIC_ROW % row)
+            write("""
             </tbody>
         </table>
     </div>
-"""
+""")
 
-        html += """
+        write("""
     <div class="footer">
         <p>Generated by Credential-License-Locator</p>
         <p><em>Use responsibly and ethically. Only scan systems you own.</em></p>
     </div>
 </body>
 </html>
-"""
-        return html
-    
-    def _build_markdown_report(self, results: Dict[str, Any]) -> str:
-        """Build Markdown report content."""
-        credentials = results.get("credentials", [])
-        licenses = results.get("licenses", [])
-        ai_analysis = results.get("ai_analysis", {})
-        
-        md = f"""# Credential & License Scan Report
+""")
 
-**Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}  
-**Directory:** {results.get('directory', 'Unknown')}
+    def _write_markdown_report(self, norm: _Norm, fp):
+        """Stream Markdown report content to an open file."""
+        ai_analysis = norm.ai_analysis
+
+        write = fp.write
+        write(f"""# Credential & License Scan Report
+
+**Generated:** {norm.ts}  
+**Directory:** {norm.directory}
 
 ---
 
 ## Summary
 
-- **Total Credentials Found:** {len(credentials)}
-- **Verified Credentials:** {sum(1 for c in credentials if c.get('verified', False))}
-- **Total License References:** {len(licenses)}
+- **Total Credentials Found:** {norm.total_creds}
+- **Verified Credentials:** {norm.verified_creds}
+- **Total License References:** {norm.total_licenses}
 
-"""
+""")
 
         # AI Analysis
         if ai_analysis and "analysis" in ai_analysis:
-            md += f"""## AI Analysis
+            write(f"""## AI Analysis
 
 **Provider:** {ai_analysis.get('provider', 'Unknown')}  
 **Model:** {ai_analysis.get('model', 'Unknown')}
@@ -291,40 +470,35 @@ class ReportGenerator:
 
 ---
 
-"""
+""")
 
         # Credentials
-        if credentials:
-            md += """## Credential Findings
+        if norm.cred_rows:
+            write("""## Credential Findings
 
 | Detector | File | Line | Severity | Verified |
 |----------|------|------|----------|----------|
-"""
-            for cred in credentials:
-                verified_mark = "✓" if cred.get("verified", False) else "✗"
-                md += f"| {cred.get('detector', 'Unknown')} | {Path(cred.get('file', 'Unknown')).name} | {cred.get('line', 'N/A')} | {cred.get('severity', 'UNKNOWN')} | {verified_mark} |\n"
-            
-            md += "\n---\n\n"
+""")
+            for row in norm.cred_rows:
+                write(_MD_CRED_ROW % (row[0], row[1], row[2], row[3], row[6]))
+
+            write("\n---\n\n")
 
         # Licenses
-        if licenses:
-            md += """## License Findings
+        if norm.lic_rows:
+            write("""## License Findings
 
 | Type | License | Source | Confidence |
 |------|---------|--------|------------|
-"""
-            for lic in licenses:
-                source = lic.get("file", lic.get("package", "Unknown"))
-                source_display = Path(source).name if lic.get("file") else source
-                md += f"| {lic.get('type', 'Unknown')} | {lic.get('license', 'Unknown')} | {source_display} | {lic.get('confidence', 'N/A')} |\n"
-            
-            md += "\n---\n\n"
-
-        md += """
+""")
+            for row in norm.lic_rows:
+                write(_MD_LIC_ROW % row)
+
+            write("\n---\n\n")
+
+        write("""
 ---
 
 *Generated by Credential-License-Locator*  
 *Use responsibly and ethically. Only scan systems you own.*
-"""
-        
-        return md
+""")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Scan Service Module
+
+Long-lived scan daemon bound to a Unix socket. Keeping one process alive
+across scans amortizes Python startup, scanner construction, and the AI
+assistant's pooled HTTP session/cache over many invocations - useful for
+developer loops that re-scan on every save.
+"""
+
+import json
+import socket
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+SOCKET_PATH = Path.home() / ".cache" / "credlicense" / "credlicense.sock"
+
+
+class _UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    """HTTP server bound to a Unix domain socket."""
+
+    def __init__(self, socket_path: str, handler_class):
+        self.socket_path = socket_path
+        super().__init__(socket_path, handler_class)
+
+
+class _ScanRequestHandler(BaseHTTPRequestHandler):
+    """Handles POST /scan requests against the long-lived scanners."""
+
+    # Set by serve() before the server starts
+    scanners: Dict[str, Any] = {}
+
+    # The scanners keep per-scan state (self.results), so concurrent
+    # handler threads must not interleave scans on the shared instances
+    _scan_lock = threading.Lock()
+
+    def do_POST(self):
+        if self.path != "/scan":
+            self._respond(404, {"error": f"Unknown path: {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length)) if length else {}
+        except (ValueError, json.JSONDecodeError):
+            self._respond(400, {"error": "Invalid JSON request body"})
+            return
+
+        directory = request.get("directory")
+        if not directory or not Path(directory).is_dir():
+            self._respond(400, {"error": f"Not a directory: {directory}"})
+            return
+
+        scan_type = request.get("scan_type", "all")
+        results: Dict[str, Any] = {"directory": directory,
+                                   "credentials": [], "licenses": []}
+
+        try:
+            with self._scan_lock:
+                if scan_type in ("all", "credentials"):
+                    results["credentials"] = self.scanners["credentials"].scan_directory(directory)
+                if scan_type in ("all", "licenses"):
+                    results["licenses"] = self.scanners["licenses"].scan_directory(directory)
+        except Exception as e:
+            self._respond(500, {"error": f"Scan failed: {e}"})
+            return
+
+        self._respond(200, results)
+
+    def _respond(self, status: int, payload: Dict[str, Any]):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Quiet by default - the CLI owns user-facing output
+        pass
+
+    def address_string(self):
+        # Peer of a Unix socket has no host:port
+        return "local"
+
+
+def serve(socket_path: Optional[str] = None):
+    """Run the scan daemon until interrupted.
+
+    Scanners (and, through them, any pooled HTTP state) are constructed
+    once and reused for every request.
+    """
+    from credlicense.core.credential_scanner import CredentialScanner
+    from credlicense.core.license_scanner import LicenseScanner
+
+    path = Path(socket_path) if socket_path else SOCKET_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()
+
+    _ScanRequestHandler.scanners = {
+        "credentials": CredentialScanner(),
+        "licenses": LicenseScanner(),
+    }
+
+    server = _UnixHTTPServer(str(path), _ScanRequestHandler)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if path.exists():
+            path.unlink()
+
+
+def request_scan(directory: str, scan_type: str = "all",
+                 socket_path: Optional[str] = None) -> Dict[str, Any]:
+    """Send a scan request to a running daemon and return its results.
+
+    Raises:
+        ConnectionError: If no daemon is listening on the socket.
+    """
+    path = str(socket_path or SOCKET_PATH)
+    body = json.dumps({"directory": directory, "scan_type": scan_type}).encode()
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            sock.connect(path)
+        except OSError as e:
+            raise ConnectionError(
+                f"No credlicense daemon at {path} (start one with 'credlicense serve')"
+            ) from e
+
+        sock.sendall(
+            b"POST /scan HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"Content-Type: application/json\r\n"
+            + f"Content-Length: {len(body)}\r\n".encode()
+            + b"Connection: close\r\n\r\n"
+            + body
+        )
+
+        response = b""
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            response += chunk
+    finally:
+        sock.close()
+
+    _, _, payload = response.partition(b"\r\n\r\n")
+    return json.loads(payload)
@@ -3,6 +3,14 @@
 
 from setuptools import setup, find_packages
 
+try:
+    # Optional: compile the report row builders when Cython is available
+    from Cython.Build import cythonize
+    ext_modules = cythonize(["credlicense/utils/_report_fast.pyx"],
+                            language_level=3)
+except ImportError:
+    ext_modules = []
+
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
@@ -15,6 +23,8 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/Grumpified-OGGVCT/Credential-License-Locator",
     packages=find_packages(),
+    package_data={"credlicense": ["templates/*.j2"]},
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -30,8 +40,6 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "truffleHog3>=3.0.0",
-        "gitpython>=3.1.0",
         "licensecheck>=2024.1",
         "pip-licenses>=4.3.0",
         "click>=8.1.0",
@@ -39,10 +47,13 @@ setup(
         "colorama>=0.4.6",
         "pyyaml>=5.4,<7.0",
         "python-dotenv>=1.0.0",
-        "openai>=1.0.0",
         "requests>=2.31.0",
-        "pillow>=10.0.0",
     ],
+    extras_require={
+        "ai": ["openai>=1.0.0"],
+        "image": ["pillow>=10.0.0"],
+        "git": ["gitpython>=3.1.0", "truffleHog3>=3.0.0"],
+    },
     entry_points={
         "console_scripts": [
             "credlicense=credlicense.cli:main",